@@ -10,6 +10,7 @@ from django_components.autodiscover import (
 from django_components.component import (
     Component as Component,
     ComponentView as ComponentView,
+    pure_context as pure_context,
 )
 from django_components.component_registry import (
     AlreadyRegistered as AlreadyRegistered,
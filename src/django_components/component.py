@@ -1,7 +1,12 @@
+# PEP 563 - annotations in this module are plain strings and are NEVER evaluated
+# at runtime. Keep it that way - `typing.get_type_hints` & co. resolve forward refs
+# and import modules, which is expensive at class creation.
+from __future__ import annotations
+
+import functools
 import inspect
 import types
-from collections import deque
-from dataclasses import dataclass
+from collections import OrderedDict, deque
 from typing import (
     Any,
     Callable,
@@ -18,16 +23,20 @@ from typing import (
     TypeVar,
     Union,
     cast,
+    get_args,
+    get_origin,
 )
 
+from django.apps import apps
+from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.forms.widgets import Media
 from django.http import HttpRequest, HttpResponse
-from django.template.base import FilterExpression, Node, NodeList, Template, TextNode
+from django.template.base import FilterExpression, Node, NodeList, Template
 from django.template.context import Context
 from django.template.exceptions import TemplateSyntaxError
 from django.template.loader import get_template
-from django.template.loader_tags import BLOCK_CONTEXT_KEY
+from django.template.loader_tags import BLOCK_CONTEXT_KEY, ExtendsNode, IncludeNode
 from django.utils.html import conditional_escape
 from django.utils.safestring import SafeString, mark_safe
 from django.views import View
@@ -51,8 +60,10 @@ from django_components.slots import (
     FillNode,
     SlotContent,
     SlotName,
+    SlotNode,
     SlotRef,
     SlotRenderedContent,
+    SlotRenderFunc,
     _nodelist_to_slot_render_func,
     resolve_slots,
 )
@@ -78,19 +89,103 @@ DataType = TypeVar("DataType", bound=Mapping[str, Any], covariant=True)
 SlotsType = TypeVar("SlotsType", bound=Mapping[SlotName, SlotContent])
 
 
-@dataclass(frozen=True)
+# NOTE: This is a plain class with `__slots__` instead of a (data)class with
+# `__dict__`, because an instance is constructed on EVERY component render.
 class RenderInput(Generic[ArgsType, KwargsType, SlotsType]):
-    context: Context
-    args: ArgsType
-    kwargs: KwargsType
-    slots: SlotsType
-    escape_slots_content: bool
+    __slots__ = ("context", "args", "kwargs", "slots", "escape_slots_content")
+
+    def __init__(
+        self,
+        context: Context,
+        args: ArgsType,
+        kwargs: KwargsType,
+        slots: SlotsType,
+        escape_slots_content: bool,
+    ) -> None:
+        self.context = context
+        self.args = args
+        self.kwargs = kwargs
+        self.slots = slots
+        self.escape_slots_content = escape_slots_content
 
 
 class ViewFn(Protocol):
     def __call__(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any: ...  # noqa: E704
 
 
+_TFunc = TypeVar("_TFunc", bound=Callable)
+
+
+def pure_context(func: _TFunc) -> _TFunc:
+    """
+    Opt-in decorator for `Component.get_context_data` which declares the method "pure" -
+    that is, its output depends ONLY on the args and kwargs it received, and NOT on
+    the component instance nor any other state.
+
+    For components with a pure `get_context_data`, the returned context data is cached
+    keyed by the inputs, so re-rendering a component with the same args/kwargs skips
+    the Python call:
+
+    ```py
+    class Calendar(Component):
+        template_name = "calendar.html"
+
+        @pure_context
+        def get_context_data(self, date):
+            return {"date": date}
+    ```
+
+    The cache holds the `_CONTEXT_DATA_CACHE_MAXSIZE` most recently used entries
+    per component class. If the args/kwargs are not hashable, caching is permanently
+    disabled for that component class, and the method is called as usual.
+    """
+    func._is_pure_context = True  # type: ignore[attr-defined]
+    return func
+
+
+# Same default bound as `functools.lru_cache`. Without a bound, a long-running
+# server rendering a pure component with ever-changing inputs (e.g. a calendar
+# keyed by date) would accumulate cached context data for the class's lifetime.
+_CONTEXT_DATA_CACHE_MAXSIZE = 128
+
+
+def _memoize_context_data(func: Callable) -> Callable:
+    """Wrap a `get_context_data` method marked with `@pure_context` with an LRU cache."""
+
+    @functools.wraps(func)
+    def wrapper(self: "Component", *args: Any, **kwargs: Any) -> Any:
+        # NOTE: The cache is stored on the class that's being rendered (NOT inherited),
+        # so each subclass gets its own cache, and the cache is garbage-collected
+        # together with the class.
+        cls = type(self)
+        if cls.__dict__.get("_context_data_cache_disabled", False):
+            return func(self, *args, **kwargs)
+
+        try:
+            key = (args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            # Unhashable inputs - the component is not pure after all, stop trying
+            cls._context_data_cache_disabled = True
+            return func(self, *args, **kwargs)
+
+        cache: Optional[OrderedDict] = cls.__dict__.get("_context_data_cache")
+        if cache is None:
+            cache = OrderedDict()
+            cls._context_data_cache = cache
+
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        result = cache[key] = func(self, *args, **kwargs)
+        if len(cache) > _CONTEXT_DATA_CACHE_MAXSIZE:
+            cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
 class ComponentMeta(MediaMeta):
     def __new__(mcs, name: str, bases: Tuple[Type, ...], attrs: Dict[str, Any]) -> Type:
         # NOTE: Skip template/media file resolution when then Component class ITSELF
@@ -137,9 +232,23 @@ class ComponentView(View, metaclass=ComponentViewMeta):
 
 
 class Component(Generic[ArgsType, KwargsType, DataType, SlotsType], metaclass=ComponentMeta):
+    # Declare slots for the attributes assigned on every instance, so their lookup
+    # skips the instance __dict__.
+    #
+    # NOTE: "__dict__" MUST be kept in the list - `__init__` re-assigns the `render`
+    # and `render_to_response` class methods as instance methods, and those names
+    # cannot be slotted (they'd conflict with the class-level attributes).
+    __slots__ = ("__dict__", "registered_name", "outer_context", "fill_content", "component_id", "_render_stack")
+
     # Either template_name or template must be set on subclass OR subclass must implement get_template() with
     # non-null return.
     _class_hash: ClassVar[int]
+    # Cache of the compiled Template instance built from the class-level `template` attribute.
+    # See `get_template`.
+    _compiled_template: ClassVar[Optional[Template]]
+    # Raw type args from `Component[Args, Kwargs, Data, Slots]` subscription, if any.
+    # See `__init_subclass__`.
+    _generic_type_args: ClassVar[Optional[Tuple[Any, ...]]] = None
 
     template_name: ClassVar[Optional[str]] = None
     """Relative filepath to the Django template associated with this component."""
@@ -194,6 +303,38 @@ class Component(Generic[ArgsType, KwargsType, DataType, SlotsType], metaclass=Co
     def __init_subclass__(cls, **kwargs: Any) -> None:
         cls._class_hash = hash(inspect.getfile(cls) + cls.__name__)
 
+        # Keep a reference to the raw type args of `Component[Args, Kwargs, Data, Slots]`
+        # (if the subclass was subscripted), so tooling and opt-in validation can
+        # get at them WITHOUT us calling `typing.get_type_hints` - these are the
+        # unevaluated type objects as written, nothing is resolved nor validated here.
+        for base in cls.__dict__.get("__orig_bases__", ()):
+            if get_origin(base) is Component:
+                cls._generic_type_args = get_args(base)
+                break
+
+        # Install the context-data cache for components whose `get_context_data`
+        # was declared pure with the `@pure_context` decorator.
+        context_data_method = cls.__dict__.get("get_context_data")
+        if context_data_method is not None and getattr(context_data_method, "_is_pure_context", False):
+            cls.get_context_data = _memoize_context_data(context_data_method)  # type: ignore[method-assign]
+
+        # Precompile the inline template at class creation. The template string is
+        # read directly from the class dict - NO annotation introspection (like
+        # `get_type_hints`) is involved, as that would resolve forward refs and
+        # import modules.
+        #
+        # NOTE: We can compile only once Django is set up (the `{% load %}` tags
+        # need the app registry). Components created before that (e.g. at
+        # app-module import) are compiled lazily in `get_template` instead.
+        template_str = cls.__dict__.get("template")
+        if isinstance(template_str, str) and settings.configured and apps.ready:
+            try:
+                cls._compiled_template = Template(template_str)
+            except Exception:
+                # Leave the cache empty, so the error surfaces on first render,
+                # wrapped with the component's name (see `Component._render`).
+                pass
+
     @property
     def name(self) -> str:
         return self.registered_name or self.__class__.__name__
@@ -224,6 +365,18 @@ class Component(Generic[ArgsType, KwargsType, DataType, SlotsType], metaclass=Co
     def get_template(self, context: Context) -> Template:
         template_string = self.get_template_string(context)
         if template_string is not None:
+            # When the template string is the class-level `template` attribute, it is
+            # immutable, and so we can compile it once and reuse the `Template` instance
+            # across renders. The compiled template is stored on the class itself
+            # (NOT inherited), so it's garbage-collected together with the class.
+            cls = type(self)
+            if template_string is cls.template:
+                compiled_template: Optional[Template] = cls.__dict__.get("_compiled_template")
+                if compiled_template is None:
+                    compiled_template = Template(template_string)
+                    cls._compiled_template = compiled_template
+                return compiled_template
+
             return Template(template_string)
 
         template_name = self.get_template_name(context)
@@ -381,6 +534,18 @@ class Component(Generic[ArgsType, KwargsType, DataType, SlotsType], metaclass=Co
             slots=slots,
             escape_slots_content=escape_slots_content,
         )
+
+        # When using the default response class as-is, pass the content as bytes,
+        # so `HttpResponse.__init__` doesn't have to re-encode the string through
+        # its content setter. Custom response classes - and extra response args,
+        # which may change the response's charset - keep receiving the plain string.
+        #
+        # NOTE: We deliberately do NOT set Content-Length here - the dependency
+        # middleware may still change the body (it fills in the JS/CSS placeholders),
+        # and Django sets the header from the final body anyway.
+        if cls.response_class is HttpResponse and not response_args and not response_kwargs:
+            return HttpResponse(content.encode(settings.DEFAULT_CHARSET))
+
         return cls.response_class(content, *response_args, **response_kwargs)
 
     @classmethod
@@ -457,6 +622,10 @@ class Component(Generic[ArgsType, KwargsType, DataType, SlotsType], metaclass=Co
     ) -> str:
         has_slots = slots is not None
 
+        # Components that received no inputs whatsoever MAY be eligible for the
+        # fast path below, where we skip the slot machinery altogether.
+        is_simple_render = not context and not args and not kwargs and not slots and not self.fill_content
+
         # Allow to provide no args/kwargs/slots/context
         args = cast(ArgsType, args or ())
         kwargs = cast(KwargsType, kwargs or {})
@@ -473,78 +642,81 @@ class Component(Generic[ArgsType, KwargsType, DataType, SlotsType], metaclass=Co
         # to access the provided context, slots, etc. Also required so users can
         # call `self.inject()` from within `get_context_data()`.
         self._render_stack.append(
-            RenderInput(
-                context=context,
-                slots=slots,
-                args=args,
-                kwargs=kwargs,
-                escape_slots_content=escape_slots_content,
-            )
+            RenderInput(context, args, kwargs, slots, escape_slots_content),
         )
 
         context_data = self.get_context_data(*args, **kwargs)
 
         with context.update(context_data):
             template = self.get_template(context)
-            _monkeypatch_template(template)
 
-            if context.template is None:
-                # Associate the newly-created Context with a Template, otherwise we get
-                # an error when we try to use `{% include %}` tag inside the template?
-                # See https://github.com/EmilStenstrom/django-components/issues/580
-                context.template = template
-                context.template_name = template.name
-
-            # Set `Template._dc_is_component_nested` based on whether we're currently INSIDE
-            # the `{% extends %}` tag.
-            # Part of fix for https://github.com/EmilStenstrom/django-components/issues/508
-            template._dc_is_component_nested = bool(context.render_context.get(BLOCK_CONTEXT_KEY))
-
-            # Support passing slots explicitly to `render` method
-            if has_slots:
-                fill_content = self._fills_from_slots_data(
-                    slots,
-                    escape_slots_content,
-                )
+            # Fast path - when the component received no args/kwargs/slots/context
+            # AND its template contains no slots, fills, nor other components,
+            # then there is nothing for the slot-resolution and context-isolation
+            # machinery to do, and we can render the template directly.
+            if is_simple_render and _is_template_trivial(template):
+                template._dc_is_component_nested = False
+                rendered_component = template.render(context)
             else:
-                fill_content = self.fill_content
-
-            # If this is top-level component and it has no parent, use outer context instead
-            slot_context_data = context_data
-            if not context[_PARENT_COMP_CONTEXT_KEY]:
-                slot_context_data = self.outer_context.flatten()
-
-            _, resolved_fills = resolve_slots(
-                context,
-                template,
-                component_name=self.name,
-                context_data=slot_context_data,
-                fill_content=fill_content,
-            )
-
-            # Available slot fills - this is internal to us
-            updated_slots = {
-                **context.get(_FILLED_SLOTS_CONTENT_CONTEXT_KEY, {}),
-                **resolved_fills,
-            }
+                _monkeypatch_template(template)
+
+                if context.template is None:
+                    # Associate the newly-created Context with a Template, otherwise we get
+                    # an error when we try to use `{% include %}` tag inside the template?
+                    # See https://github.com/EmilStenstrom/django-components/issues/580
+                    context.template = template
+                    context.template_name = template.name
+
+                # Set `Template._dc_is_component_nested` based on whether we're currently INSIDE
+                # the `{% extends %}` tag.
+                # Part of fix for https://github.com/EmilStenstrom/django-components/issues/508
+                template._dc_is_component_nested = bool(context.render_context.get(BLOCK_CONTEXT_KEY))
+
+                # Support passing slots explicitly to `render` method
+                if has_slots:
+                    fill_content = self._fills_from_slots_data(
+                        slots,
+                        escape_slots_content,
+                    )
+                else:
+                    fill_content = self.fill_content
+
+                # If this is top-level component and it has no parent, use outer context instead
+                slot_context_data = context_data
+                if not context[_PARENT_COMP_CONTEXT_KEY]:
+                    slot_context_data = self.outer_context.flatten()
+
+                _, resolved_fills = resolve_slots(
+                    context,
+                    template,
+                    component_name=self.name,
+                    context_data=slot_context_data,
+                    fill_content=fill_content,
+                )
 
-            # For users, we expose boolean variables that they may check
-            # to see if given slot was filled, e.g.:
-            # `{% if variable > 8 and component_vars.is_filled.header %}`
-            slot_bools = {slot_fill.escaped_name: slot_fill.is_filled for slot_fill in resolved_fills.values()}
-
-            with context.update(
-                {
-                    _ROOT_CTX_CONTEXT_KEY: self.outer_context,
-                    _FILLED_SLOTS_CONTENT_CONTEXT_KEY: updated_slots,
-                    # NOTE: Public API for variables accessible from within a component's template
-                    # See https://github.com/EmilStenstrom/django-components/issues/280#issuecomment-2081180940
-                    "component_vars": {
-                        "is_filled": slot_bools,
-                    },
+                # Available slot fills - this is internal to us
+                updated_slots = {
+                    **context.get(_FILLED_SLOTS_CONTENT_CONTEXT_KEY, {}),
+                    **resolved_fills,
                 }
-            ):
-                rendered_component = template.render(context)
+
+                # For users, we expose boolean variables that they may check
+                # to see if given slot was filled, e.g.:
+                # `{% if variable > 8 and component_vars.is_filled.header %}`
+                slot_bools = {slot_fill.escaped_name: slot_fill.is_filled for slot_fill in resolved_fills.values()}
+
+                with context.update(
+                    {
+                        _ROOT_CTX_CONTEXT_KEY: self.outer_context,
+                        _FILLED_SLOTS_CONTENT_CONTEXT_KEY: updated_slots,
+                        # NOTE: Public API for variables accessible from within a component's template
+                        # See https://github.com/EmilStenstrom/django-components/issues/280#issuecomment-2081180940
+                        "component_vars": {
+                            "is_filled": slot_bools,
+                        },
+                    }
+                ):
+                    rendered_component = template.render(context)
 
         if is_dependency_middleware_active():
             output = RENDERED_COMMENT_TEMPLATE.format(name=self.name) + rendered_component
@@ -565,15 +737,15 @@ class Component(Generic[ArgsType, KwargsType, DataType, SlotsType], metaclass=Co
         """Fill component slots outside of template rendering."""
         slot_fills = {}
         for slot_name, content in slots_data.items():
+            content_func: SlotRenderFunc
             if isinstance(content, (str, SafeString)):
-                content_func = _nodelist_to_slot_render_func(
-                    NodeList([TextNode(conditional_escape(content) if escape_content else content)])
-                )
+                # A string fill has nothing to resolve at render time, so escape it
+                # once here and return it from the render function as-is - no need
+                # to wrap it in a nodelist and re-render it on each use.
+                static_content = mark_safe(conditional_escape(content) if escape_content else content)
+                content_func = _make_static_fill_func(static_content)
             else:
-
-                def content_func(ctx: Context, kwargs: Dict[str, Any], slot_ref: SlotRef) -> SlotRenderedContent:
-                    rendered = content(ctx, kwargs, slot_ref)
-                    return conditional_escape(rendered) if escape_content else rendered
+                content_func = _make_escaping_fill_func(content, escape_content)
 
             slot_fills[slot_name] = FillContent(
                 content_func=content_func,
@@ -671,6 +843,54 @@ class ComponentNode(Node):
         return output
 
 
+# NOTE: These are factory functions (instead of defining `content_func` inline in
+# `Component._fills_from_slots_data`) so that each fill closes over ITS OWN content,
+# and so mypy sees a single consistent `content_func` binding.
+def _make_static_fill_func(content: SafeString) -> SlotRenderFunc:
+    def content_func(ctx: Context, kwargs: Dict[str, Any], slot_ref: SlotRef) -> SlotRenderedContent:
+        return content
+
+    return content_func
+
+
+def _make_escaping_fill_func(content: SlotRenderFunc, escape: bool) -> SlotRenderFunc:
+    def content_func(ctx: Context, kwargs: Dict[str, Any], slot_ref: SlotRef) -> SlotRenderedContent:
+        rendered = content(ctx, kwargs, slot_ref)
+        return conditional_escape(rendered) if escape else rendered
+
+    return content_func
+
+
+def _is_template_trivial(template: Template) -> bool:
+    """
+    Check whether the template is "trivial" - one that contains no slots, fills,
+    nor other components, and thus can be rendered without the slot-resolution
+    machinery.
+
+    The result is cached on the Template instance, so the nodelist is scanned
+    only once per template.
+    """
+    is_trivial: Optional[bool] = getattr(template, "_dc_is_trivial", None)
+    if is_trivial is not None:
+        return is_trivial
+
+    # NOTE: `{% include %}` and `{% extends %}` tags pull in other templates, which
+    # may define slots or components. We don't expand them here (that requires
+    # a Context), so we conservatively treat them as non-trivial.
+    nodes: List[Node] = list(template.nodelist)
+    is_trivial = True
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, (SlotNode, FillNode, ComponentNode, IncludeNode, ExtendsNode)):
+            is_trivial = False
+            break
+        for attr in node.child_nodelists:
+            nodes.extend(getattr(node, attr, None) or [])
+
+    template._dc_is_trivial = is_trivial
+    return is_trivial
+
+
 def _monkeypatch_template(template: Template) -> None:
     # Modify `Template.render` to set `isolated_context` kwarg of `push_state`
     # based on our custom `Template._dc_is_component_nested`.
@@ -717,3 +937,4 @@ def _monkeypatch_template(template: Template) -> None:
 
     # See https://stackoverflow.com/a/42154067/9788634
     template.render = types.MethodType(_template_render, template)
+    template._dc_patched = True
@@ -1,3 +1,4 @@
+import sys
 from typing import TYPE_CHECKING, Callable, Dict, NamedTuple, Optional, Set, Type, TypeVar
 
 from django.template import Library
@@ -109,6 +110,10 @@ class ComponentRegistry:
         registry.register("button", ButtonComponent)
         ```
         """
+        # Intern the name, so the per-render name comparisons are pointer-fast
+        if type(name) is str:
+            name = sys.intern(name)
+
         existing_component = self._registry.get(name)
         if existing_component and existing_component.cls._class_hash != component._class_hash:
             raise AlreadyRegistered('The component "%s" has already been registered' % name)
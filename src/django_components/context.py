@@ -33,6 +33,8 @@ def prepare_context(
 
 
 def make_isolated_context_copy(context: Context) -> Context:
+    # NOTE: `Context.new()` shares the engine's builtins with the original, but
+    # does NOT copy the other layers, so this is cheaper than `Context({...})`.
     context_copy = context.new()
     copy_forloop_context(context, context_copy)
 
@@ -42,10 +44,8 @@ def make_isolated_context_copy(context: Context) -> Context:
         context_copy[_ROOT_CTX_CONTEXT_KEY] = context[_ROOT_CTX_CONTEXT_KEY]
 
     # Make inject/provide to work in isolated mode
-    context_keys = context.flatten().keys()
-    for key in context_keys:
-        if key.startswith(_INJECT_CONTEXT_KEY_PREFIX):
-            context_copy[key] = context[key]
+    for key, value in collect_provided_context_vars(context).items():
+        context_copy[key] = value
 
     return context_copy
 
@@ -74,6 +74,23 @@ def copy_forloop_context(from_context: Context, to_context: Context) -> None:
         to_context.update(from_context.dicts[forloop_dict_index])
 
 
+def collect_provided_context_vars(context: Context) -> Dict[str, Any]:
+    """
+    Collect all the 'provided' fields (set by the `{% provide %}` tag) from the context.
+
+    Unlike `Context.flatten()`, this walks the context layers directly, so we don't
+    allocate a merged dict of the WHOLE context just to pluck out our keys.
+    """
+    # NOTE: We walk the layers from the bottom up, so "newer" values overshadow
+    # the "older" ones, same as `Context.flatten()` does.
+    provided: Dict[str, Any] = {}
+    for layer in context.dicts:
+        for key in layer:
+            if key.startswith(_INJECT_CONTEXT_KEY_PREFIX):
+                provided[key] = layer[key]
+    return provided
+
+
 def get_injected_context_var(
     component_name: str,
     context: Context,
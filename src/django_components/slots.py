@@ -8,13 +8,14 @@ from django.template import Context, Template
 from django.template.base import FilterExpression, Node, NodeList, Parser, TextNode
 from django.template.defaulttags import CommentNode
 from django.template.exceptions import TemplateSyntaxError
+from django.template.loader_tags import ExtendsNode, IncludeNode
 from django.utils.safestring import SafeString, mark_safe
 
 from django_components.app_settings import ContextBehavior, app_settings
 from django_components.context import (
     _FILLED_SLOTS_CONTENT_CONTEXT_KEY,
-    _INJECT_CONTEXT_KEY_PREFIX,
     _ROOT_CTX_CONTEXT_KEY,
+    collect_provided_context_vars,
 )
 from django_components.expression import Expression, resolve_expression_as_identifier, safe_resolve_dict
 from django_components.logger import trace_msg
@@ -145,17 +146,13 @@ class SlotNode(Node):
         # NOTE: Slot entry MUST be present. If it's missing, there was an issue upstream.
         slot_fill = slots[self.node_id]
 
-        extra_context: Dict[str, Any] = {}
-
         # Irrespective of which context we use ("root" context or the one passed to this
         # render function), pass down the keys used by inject/provide feature. This makes it
         # possible to pass the provided values down the slots, e.g.:
         # {% provide "abc" val=123 %}
         #   {% slot "content" %}{% endslot %}
         # {% endprovide %}
-        for key, value in context.flatten().items():
-            if key.startswith(_INJECT_CONTEXT_KEY_PREFIX):
-                extra_context[key] = value
+        extra_context: Dict[str, Any] = collect_provided_context_vars(context)
 
         # If slot fill is using `{% fill "myslot" default="abc" %}`, then set the "abc" to
         # the context, so users can refer to the default slot from within the fill content.
@@ -396,48 +393,7 @@ def resolve_slots(
         for name, fill in fill_content.items()
     }
 
-    slots: Dict[SlotId, Slot] = {}
-    # This holds info on which slot (key) has which slots nested in it (value list)
-    slot_children: Dict[SlotId, List[SlotId]] = {}
-
-    def on_node(entry: NodeTraverse) -> None:
-        node = entry.node
-        if not isinstance(node, SlotNode):
-            return
-
-        # 1. Collect slots
-        # Basically we take all the important info form the SlotNode, so the logic is
-        # less coupled to Django's Template/Node. Plain tuples should also help with
-        # troubleshooting.
-        slot = Slot(
-            id=node.node_id,
-            name=node.name,
-            nodelist=node.nodelist,
-            is_default=node.is_default,
-            is_required=node.is_required,
-        )
-        slots[node.node_id] = slot
-
-        # 2. Figure out which Slots are nested in other Slots, so we can render
-        # them from outside-inwards, so we can skip inner Slots if fills are provided.
-        # We should end up with a graph-like data like:
-        # - 0001: [0002]
-        # - 0002: []
-        # - 0003: [0004]
-        # In other words, the data tells us that slot ID 0001 is PARENT of slot 0002.
-        curr_entry = entry.parent
-        while curr_entry and curr_entry.parent is not None:
-            if not isinstance(curr_entry.node, SlotNode):
-                curr_entry = curr_entry.parent
-                continue
-
-            parent_slot_id = curr_entry.node.node_id
-            if parent_slot_id not in slot_children:
-                slot_children[parent_slot_id] = []
-            slot_children[parent_slot_id].append(node.node_id)
-            break
-
-    walk_nodelist(template.nodelist, on_node, context)
+    slots, slot_children = _collect_slots(template, context)
 
     # 3. Figure out which slot the default/implicit fill belongs to
     slot_fills = _resolve_default_slot(
@@ -492,6 +448,82 @@ def resolve_slots(
     return slots, resolved_slots
 
 
+def _collect_slots(
+    template: Template,
+    context: Context,
+) -> Tuple[Dict[SlotId, Slot], Dict[SlotId, List[SlotId]]]:
+    """
+    Walk the template's nodelist and collect:
+    - Slots defined in the template with the `{% slot %}` tag
+    - Which slots are nested in which other slots
+
+    Since Templates and their nodelists are treated as immutable, the result of
+    the walk is cached on the Template instance, so each template is walked only
+    once. The exception to that are templates using `{% include %}` or
+    `{% extends %}` tags - these may expand to different templates based on the
+    context, so we re-walk them on each render.
+    """
+    cache = getattr(template, "_dc_slots_cache", None)
+    if cache is not None:
+        return cache
+
+    slots: Dict[SlotId, Slot] = {}
+    # This holds info on which slot (key) has which slots nested in it (value list)
+    slot_children: Dict[SlotId, List[SlotId]] = {}
+    # Whether the template pulls in other templates that must be resolved against
+    # the current context
+    has_dynamic_nodes = False
+
+    def on_node(entry: NodeTraverse) -> None:
+        nonlocal has_dynamic_nodes
+
+        node = entry.node
+        if isinstance(node, (ExtendsNode, IncludeNode)):
+            has_dynamic_nodes = True
+            return
+        if not isinstance(node, SlotNode):
+            return
+
+        # 1. Collect slots
+        # Basically we take all the important info form the SlotNode, so the logic is
+        # less coupled to Django's Template/Node. Plain tuples should also help with
+        # troubleshooting.
+        slot = Slot(
+            id=node.node_id,
+            name=node.name,
+            nodelist=node.nodelist,
+            is_default=node.is_default,
+            is_required=node.is_required,
+        )
+        slots[node.node_id] = slot
+
+        # 2. Figure out which Slots are nested in other Slots, so we can render
+        # them from outside-inwards, so we can skip inner Slots if fills are provided.
+        # We should end up with a graph-like data like:
+        # - 0001: [0002]
+        # - 0002: []
+        # - 0003: [0004]
+        # In other words, the data tells us that slot ID 0001 is PARENT of slot 0002.
+        curr_entry = entry.parent
+        while curr_entry and curr_entry.parent is not None:
+            if not isinstance(curr_entry.node, SlotNode):
+                curr_entry = curr_entry.parent
+                continue
+
+            parent_slot_id = curr_entry.node.node_id
+            if parent_slot_id not in slot_children:
+                slot_children[parent_slot_id] = []
+            slot_children[parent_slot_id].append(node.node_id)
+            break
+
+    walk_nodelist(template.nodelist, on_node, context)
+
+    if not has_dynamic_nodes:
+        template._dc_slots_cache = (slots, slot_children)
+
+    return slots, slot_children
+
+
 def _resolve_default_slot(
     template_name: str,
     component_name: Optional[str],
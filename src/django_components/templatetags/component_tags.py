@@ -1,3 +1,4 @@
+import sys
 from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 import django.template
@@ -553,6 +554,11 @@ def _parse_slot_args(
         raise TemplateSyntaxError(f"'{tag.name}' name must be a string 'literal', got {slot_name}.")
 
     slot_name = resolve_string(slot_name, parser)
+    # Intern the name, so the per-render slot name comparisons are pointer-fast.
+    # NOTE: Only plain strings can be interned - `resolve_string` may also
+    # return e.g. SafeString.
+    if type(slot_name) is str:
+        slot_name = sys.intern(slot_name)
 
     return ParsedSlotTag(name=slot_name)
 
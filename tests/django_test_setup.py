@@ -19,6 +19,23 @@ def setup_test_config(components: Optional[Dict] = None):
                     "tests/templates/",
                     "tests/components/",  # Required for template relative imports in tests
                 ],
+                "OPTIONS": {
+                    # Wrap the loaders in the cached loader EXPLICITLY, so that templates
+                    # loaded with `{% include %}` etc. are read and parsed from disk only
+                    # once per test run.
+                    # NOTE: Tests that change template dirs MUST purge the cache with
+                    # `engines.all()[0].engine.template_loaders[0].reset()`
+                    # (`parametrize_context_behavior` already does so).
+                    "loaders": [
+                        (
+                            "django.template.loaders.cached.Loader",
+                            [
+                                "django.template.loaders.filesystem.Loader",
+                                "django.template.loaders.app_directories.Loader",
+                            ],
+                        )
+                    ],
+                },
             }
         ],
         COMPONENTS={
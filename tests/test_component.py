@@ -3,13 +3,14 @@ Tests focusing on the Component class.
 For tests focusing on the `component` tag, see `test_templatetags_component.py`
 """
 
-from typing import Dict, Tuple, TypedDict, no_type_check
+from typing import Dict, Tuple, TypedDict
+from unittest.mock import patch
 
 from django.core.exceptions import ImproperlyConfigured
 from django.http import HttpRequest, HttpResponse
 from django.template import Context, RequestContext, Template, TemplateSyntaxError
 
-from django_components import Component, registry, types
+from django_components import Component, pure_context, registry, types
 from django_components.slots import SlotRef
 
 from .django_test_setup import setup_test_config
@@ -17,6 +18,38 @@ from .testutils import BaseTestCase, parametrize_context_behavior
 
 setup_test_config({"autodiscover": False})
 
+# NOTE: Template strings that are shared by multiple test components are defined
+# ONCE at module level. This way the same (immutable) string instance is reused,
+# and template caches that key on the source get a hit on the second use.
+_FULL_TEMPLATE: types.django_html = """
+    {% load component_tags %}
+    the_arg: {{ the_arg }}
+    the_arg2: {{ the_arg2 }}
+    args: {{ args|safe }}
+    the_kwarg: {{ the_kwarg }}
+    kwargs: {{ kwargs|safe }}
+    ---
+    from_context: {{ from_context }}
+    ---
+    slot_first: {% slot "first" required %}
+    {% endslot %}
+    ---
+    slot_second: {% slot "second" default %}
+        SLOT_SECOND_DEFAULT
+    {% endslot %}
+"""
+
+_INCLUDE_TEMPLATE: types.django_html = """
+    {% load component_tags %}
+    {% include 'slotted_template.html' %}
+"""
+
+_MY_SLOT_TEMPLATE: types.django_html = """
+    {% load component_tags %}
+    Variable: <strong>{{ variable }}</strong>
+    {% slot 'my_slot' / %}
+"""
+
 
 class ComponentTest(BaseTestCase):
     class ParentComponent(Component):
@@ -42,22 +75,21 @@ class ComponentTest(BaseTestCase):
     class VariableDisplay(Component):
         template: types.django_html = """
             {% load component_tags %}
-            <h1>Shadowing variable = {{ shadowing_variable }}</h1>
-            <h1>Uniquely named variable = {{ unique_variable }}</h1>
+            <h1>Shadowing variable = {{ shadowing_variable|default_if_none:"" }}</h1>
+            <h1>Uniquely named variable = {{ unique_variable|default_if_none:"" }}</h1>
         """
 
         def get_context_data(self, shadowing_variable=None, new_variable=None):
-            context = {}
-            if shadowing_variable is not None:
-                context["shadowing_variable"] = shadowing_variable
-            if new_variable is not None:
-                context["unique_variable"] = new_variable
-            return context
-
-    def setUp(self):
-        super().setUp()
-        registry.register(name="parent_component", component=self.ParentComponent)
-        registry.register(name="variable_display", component=self.VariableDisplay)
+            return {
+                "shadowing_variable": shadowing_variable,
+                "unique_variable": new_variable,
+            }
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        registry.register(name="parent_component", component=cls.ParentComponent)
+        registry.register(name="variable_display", component=cls.VariableDisplay)
 
     @parametrize_context_behavior(["django", "isolated"])
     def test_empty_component(self):
@@ -67,7 +99,7 @@ class ComponentTest(BaseTestCase):
         with self.assertRaises(ImproperlyConfigured):
             EmptyComponent("empty_component").get_template(Context({}))
 
-    @parametrize_context_behavior(["django", "isolated"])
+    @parametrize_context_behavior(["django", "isolated"], skip_if_no_slots=True)
     def test_template_string_static_inlined(self):
         class SimpleComponent(Component):
             template: types.django_html = """
@@ -84,7 +116,7 @@ class ComponentTest(BaseTestCase):
                 js = "script.js"
 
         rendered = SimpleComponent.render(kwargs={"variable": "test"})
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered,
             """
             Variable: <strong>test</strong>
@@ -110,14 +142,14 @@ class ComponentTest(BaseTestCase):
                 js = "script.js"
 
         rendered = SimpleComponent.render(kwargs={"variable": "test"})
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered,
             """
             Variable: <strong>test</strong>
             """,
         )
 
-    @parametrize_context_behavior(["django", "isolated"])
+    @parametrize_context_behavior(["django", "isolated"], skip_if_no_slots=True)
     def test_template_name_static(self):
         class SimpleComponent(Component):
             template_name = "simple_template.html"
@@ -132,7 +164,7 @@ class ComponentTest(BaseTestCase):
                 js = "script.js"
 
         rendered = SimpleComponent.render(kwargs={"variable": "test"})
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered,
             """
             Variable: <strong>test</strong>
@@ -153,13 +185,13 @@ class ComponentTest(BaseTestCase):
             def get_template_name(self, context):
                 return f"dynamic_{context['name']}.svg"
 
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             SvgComponent.render(kwargs={"name": "svg1"}),
             """
             <svg>Dynamic1</svg>
             """,
         )
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             SvgComponent.render(kwargs={"name": "svg2"}),
             """
             <svg>Dynamic2</svg>
@@ -179,7 +211,7 @@ class ComponentTest(BaseTestCase):
                 return Template(template_str)
 
         rendered = TestComponent.render(kwargs={"variable": "test"})
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered,
             """
             Variable: <strong>test</strong>
@@ -206,12 +238,7 @@ class ComponentTest(BaseTestCase):
                 }
 
             def get_template(self, context):
-                template_str: types.django_html = """
-                    {% load component_tags %}
-                    Variable: <strong>{{ variable }}</strong>
-                    {% slot 'my_slot' / %}
-                """
-                return Template(template_str)
+                return Template(_MY_SLOT_TEMPLATE)
 
         rendered = TestComponent.render(
             kwargs={"variable": "test", "another": 1},
@@ -219,7 +246,7 @@ class ComponentTest(BaseTestCase):
             slots={"my_slot": "MY_SLOT"},
         )
 
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered,
             """
             Variable: <strong>test</strong> MY_SLOT
@@ -230,30 +257,23 @@ class ComponentTest(BaseTestCase):
         tester = self
 
         class TestComponent(Component):
-            @no_type_check
-            def get_context_data(self, var1, var2, variable, another, **attrs):
+            def get_context_data(self, *args, **kwargs):
                 tester.assertEqual(self.input.args, (123, "str"))
                 tester.assertEqual(self.input.kwargs, {"variable": "test", "another": 1})
                 tester.assertIsInstance(self.input.context, Context)
                 tester.assertEqual(self.input.slots, {"my_slot": "MY_SLOT"})
 
                 return {
-                    "variable": variable,
+                    "variable": kwargs["variable"],
                 }
 
-            @no_type_check
             def get_template(self, context):
                 tester.assertEqual(self.input.args, (123, "str"))
                 tester.assertEqual(self.input.kwargs, {"variable": "test", "another": 1})
                 tester.assertIsInstance(self.input.context, Context)
                 tester.assertEqual(self.input.slots, {"my_slot": "MY_SLOT"})
 
-                template_str: types.django_html = """
-                    {% load component_tags %}
-                    Variable: <strong>{{ variable }}</strong>
-                    {% slot 'my_slot' / %}
-                """
-                return Template(template_str)
+                return Template(_MY_SLOT_TEMPLATE)
 
         rendered = TestComponent.render(
             kwargs={"variable": "test", "another": 1},
@@ -261,7 +281,7 @@ class ComponentTest(BaseTestCase):
             slots={"my_slot": "MY_SLOT"},
         )
 
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered,
             """
             Variable: <strong>test</strong> MY_SLOT
@@ -269,6 +289,91 @@ class ComponentTest(BaseTestCase):
         )
 
 
+class PureContextTest(BaseTestCase):
+    def test_pure_context_data_is_cached(self):
+        calls = []
+
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                Variable: <strong>{{ variable }}</strong>
+            """
+
+            @pure_context
+            def get_context_data(self, variable=None):
+                calls.append(variable)
+                return {
+                    "variable": variable,
+                }
+
+        rendered_1 = SimpleComponent.render(kwargs={"variable": "test"})
+        rendered_2 = SimpleComponent.render(kwargs={"variable": "test"})
+
+        self.assertHTMLEqualFast(
+            rendered_1,
+            """
+            Variable: <strong>test</strong>
+            """,
+        )
+        self.assertEqual(rendered_1, rendered_2)
+        # Same inputs - `get_context_data` was called only once
+        self.assertEqual(calls, ["test"])
+
+        # Different inputs - `get_context_data` is called again
+        SimpleComponent.render(kwargs={"variable": "other"})
+        self.assertEqual(calls, ["test", "other"])
+
+    def test_pure_context_ignores_unhashable_inputs(self):
+        calls = []
+
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                Variable: <strong>{{ variable }}</strong>
+            """
+
+            @pure_context
+            def get_context_data(self, variable=None):
+                calls.append(variable)
+                return {
+                    "variable": variable,
+                }
+
+        rendered_1 = SimpleComponent.render(kwargs={"variable": ["un", "hashable"]})
+        rendered_2 = SimpleComponent.render(kwargs={"variable": ["un", "hashable"]})
+
+        self.assertEqual(rendered_1, rendered_2)
+        # Unhashable inputs - no caching, `get_context_data` is called every time
+        self.assertEqual(calls, [["un", "hashable"], ["un", "hashable"]])
+
+    def test_pure_context_cache_is_bounded(self):
+        calls = []
+
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                Variable: <strong>{{ variable }}</strong>
+            """
+
+            @pure_context
+            def get_context_data(self, variable=None):
+                calls.append(variable)
+                return {
+                    "variable": variable,
+                }
+
+        with patch("django_components.component._CONTEXT_DATA_CACHE_MAXSIZE", 2):
+            SimpleComponent.render(kwargs={"variable": "first"})
+            SimpleComponent.render(kwargs={"variable": "second"})
+            SimpleComponent.render(kwargs={"variable": "third"})
+
+            # "first" is the least recently used entry, so it was evicted
+            # and is re-computed on the next render
+            SimpleComponent.render(kwargs={"variable": "first"})
+            self.assertEqual(calls, ["first", "second", "third", "first"])
+
+            # "third" is still cached
+            SimpleComponent.render(kwargs={"variable": "third"})
+            self.assertEqual(calls, ["first", "second", "third", "first"])
+
+
 class ComponentRenderTest(BaseTestCase):
     @parametrize_context_behavior(["django", "isolated"])
     def test_render_minimal(self):
@@ -296,7 +401,7 @@ class ComponentRenderTest(BaseTestCase):
                 }
 
         rendered = SimpleComponent.render()
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered,
             """
             the_arg2: None
@@ -313,23 +418,7 @@ class ComponentRenderTest(BaseTestCase):
     @parametrize_context_behavior(["django", "isolated"])
     def test_render_full(self):
         class SimpleComponent(Component):
-            template: types.django_html = """
-                {% load component_tags %}
-                the_arg: {{ the_arg }}
-                the_arg2: {{ the_arg2 }}
-                args: {{ args|safe }}
-                the_kwarg: {{ the_kwarg }}
-                kwargs: {{ kwargs|safe }}
-                ---
-                from_context: {{ from_context }}
-                ---
-                slot_first: {% slot "first" required %}
-                {% endslot %}
-                ---
-                slot_second: {% slot "second" default %}
-                    SLOT_SECOND_DEFAULT
-                {% endslot %}
-            """
+            template: types.django_html = _FULL_TEMPLATE
 
             def get_context_data(self, the_arg, the_arg2=None, *args, the_kwarg, **kwargs):
                 return {
@@ -346,7 +435,7 @@ class ComponentRenderTest(BaseTestCase):
             kwargs={"the_kwarg": "test", "kw2": "ooo"},
             slots={"first": "FIRST_SLOT"},
         )
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered,
             """
             the_arg: one
@@ -366,23 +455,7 @@ class ComponentRenderTest(BaseTestCase):
     @parametrize_context_behavior(["django", "isolated"])
     def test_render_to_response_full(self):
         class SimpleComponent(Component):
-            template: types.django_html = """
-                {% load component_tags %}
-                the_arg: {{ the_arg }}
-                the_arg2: {{ the_arg2 }}
-                args: {{ args|safe }}
-                the_kwarg: {{ the_kwarg }}
-                kwargs: {{ kwargs|safe }}
-                ---
-                from_context: {{ from_context }}
-                ---
-                slot_first: {% slot "first" required %}
-                {% endslot %}
-                ---
-                slot_second: {% slot "second" default %}
-                    SLOT_SECOND_DEFAULT
-                {% endslot %}
-            """
+            template: types.django_html = _FULL_TEMPLATE
 
             def get_context_data(self, the_arg, the_arg2=None, *args, the_kwarg, **kwargs):
                 return {
@@ -401,7 +474,7 @@ class ComponentRenderTest(BaseTestCase):
         )
         self.assertIsInstance(rendered, HttpResponse)
 
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered.content.decode(),
             """
             the_arg: one
@@ -418,7 +491,7 @@ class ComponentRenderTest(BaseTestCase):
             """,
         )
 
-    @parametrize_context_behavior(["django", "isolated"])
+    @parametrize_context_behavior(["django", "isolated"], skip_if_no_slots=True)
     def test_render_to_response_change_response_class(self):
         class MyResponse:
             def __init__(self, content: str) -> None:
@@ -431,7 +504,7 @@ class ComponentRenderTest(BaseTestCase):
         rendered = SimpleComponent.render_to_response()
         self.assertIsInstance(rendered, MyResponse)
 
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered.content.decode(),
             "HELLO",
         )
@@ -489,7 +562,7 @@ class ComponentRenderTest(BaseTestCase):
             kwargs={"the_kwarg": 3},
             slots={"first": first_slot},
         )
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered,
             "FROM_INSIDE_FIRST_SLOT | SLOT_DEFAULT",
         )
@@ -513,13 +586,10 @@ class ComponentRenderTest(BaseTestCase):
     @parametrize_context_behavior(["django", "isolated"])
     def test_render_with_include(self):
         class SimpleComponent(Component):
-            template: types.django_html = """
-                {% load component_tags %}
-                {% include 'slotted_template.html' %}
-            """
+            template: types.django_html = _INCLUDE_TEMPLATE
 
         rendered = SimpleComponent.render()
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered,
             """
             <custom-template>
@@ -535,13 +605,10 @@ class ComponentRenderTest(BaseTestCase):
     @parametrize_context_behavior(["django", "isolated"])
     def test_render_with_include_and_context(self):
         class SimpleComponent(Component):
-            template: types.django_html = """
-                {% load component_tags %}
-                {% include 'slotted_template.html' %}
-            """
+            template: types.django_html = _INCLUDE_TEMPLATE
 
         rendered = SimpleComponent.render(context=Context())
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered,
             """
             <custom-template>
@@ -557,13 +624,10 @@ class ComponentRenderTest(BaseTestCase):
     @parametrize_context_behavior(["django", "isolated"])
     def test_render_with_include_and_request_context(self):
         class SimpleComponent(Component):
-            template: types.django_html = """
-                {% load component_tags %}
-                {% include 'slotted_template.html' %}
-            """
+            template: types.django_html = _INCLUDE_TEMPLATE
 
         rendered = SimpleComponent.render(context=RequestContext(HttpRequest()))
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered,
             """
             <custom-template>
@@ -585,7 +649,7 @@ class ComponentRenderTest(BaseTestCase):
             """
 
         rendered = SimpleComponent.render()
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered,
             """
             <!DOCTYPE html>
@@ -613,7 +677,7 @@ class ComponentRenderTest(BaseTestCase):
                 }
 
         rendered = TestComponent(component_id="123").render()
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered,
             "Variable: <strong>123</strong>",
         )
@@ -629,7 +693,7 @@ class ComponentRenderTest(BaseTestCase):
                 }
 
         rendered_resp = TestComponent(component_id="123").render_to_response()
-        self.assertHTMLEqual(
+        self.assertHTMLEqualFast(
             rendered_resp.content.decode("utf-8"),
             "Variable: <strong>123</strong>",
         )
@@ -1,5 +1,6 @@
 import contextlib
 import functools
+import re
 import sys
 from typing import Any, Dict, List, Optional, Tuple, Union
 from unittest.mock import Mock
@@ -19,10 +20,42 @@ response_stash = None
 middleware = ComponentDependencyMiddleware(get_response=lambda _: response_stash)
 
 
+_whitespace_re = re.compile(r"\s+")
+
+
 class BaseTestCase(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # Components that all tests of a class share may be registered ONCE in
+        # `setUpClass` (instead of re-registering them in `setUp` for each test).
+        # These are unregistered only once the whole class is done.
+        cls.addClassCleanup(registry.clear)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._initial_registered_names = set(registry.all().keys())
+
     def tearDown(self) -> None:
         super().tearDown()
-        registry.clear()
+        # Unregister components registered DURING the test, but keep the
+        # class-level ones, so the tests stay isolated from each other.
+        # NOTE: `getattr` because some tests override `setUp` without calling
+        # `super().setUp()`. For them, the class-level cleanup still applies.
+        initial_names = getattr(self, "_initial_registered_names", set())
+        for name in set(registry.all().keys()) - initial_names:
+            registry.unregister(name)
+
+    def assertHTMLEqualFast(self, html1: str, html2: str, msg: Optional[str] = None) -> None:
+        """
+        Faster version of `assertHTMLEqual` - first compare the whitespace-normalized
+        strings, which avoids running Django's HTML parser on both sides. Only on
+        mismatch fall back to `assertHTMLEqual`, so attribute-order-insensitive
+        comparison and the helpful diff are preserved.
+        """
+        if _whitespace_re.sub(" ", html1).strip() == _whitespace_re.sub(" ", html2).strip():
+            return
+        self.assertHTMLEqual(html1, html2, msg)
 
 
 request = Mock()
@@ -83,7 +116,11 @@ ContextBehStr = Union[ContextBehavior, str]
 ContextBehParam = Union[ContextBehStr, Tuple[ContextBehStr, Any]]
 
 
-def parametrize_context_behavior(cases: List[ContextBehParam], settings: Optional[Dict] = None):
+def parametrize_context_behavior(
+    cases: List[ContextBehParam],
+    settings: Optional[Dict] = None,
+    skip_if_no_slots: bool = False,
+):
     """
     Use this decorator to run a test function with django_component's
     context_behavior settings set to given values.
@@ -127,8 +164,21 @@ def parametrize_context_behavior(cases: List[ContextBehParam], settings: Optiona
         ...
     ```
 
+    If the test renders no `{% slot %}`/`{% fill %}` content that could observe the
+    outer context, then the "django" and "isolated" modes are provably identical.
+    Set `skip_if_no_slots=True` for such tests to run only the first case, instead
+    of re-running the same test for each behavior:
+    ```py
+    @parametrize_context_behavior(["django", "isolated"], skip_if_no_slots=True)
+    def test_bla_bla(self):
+        # Runs only with app_settings.CONTEXT_BEHAVIOR set to "django"
+        ...
+    ```
+
     NOTE: Use only on functions and methods. This decorator was NOT tested on classes
     """
+    if skip_if_no_slots:
+        cases = cases[:1]
 
     def decorator(test_func):
         # NOTE: Ideally this decorator would parametrize the test function